@@ -1,7 +1,10 @@
 import ast
+import logging
+import time
 import streamlit as st
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.api_core import exceptions as google_exceptions
 import pandas as pd
 import plotly.express as px
 
@@ -17,17 +20,77 @@ if not firebase_admin._apps:  # Ensure Firebase is initialized only once
 # Firestore client
 db = firestore.client()
 
-# Fetch all movie data
-movies_ref = db.collection('movies2')
-movies = movies_ref.stream()
-movie_data = [movie.to_dict() for movie in movies]
+# Number of documents read from Firestore before a chunk is handed to pandas
+CHUNK_SIZE = 500
+
+# Coerced per chunk so every chunk agrees on dtype before they are concatenated
+NUMERIC_COLUMNS = ['release_year', 'popularity', 'revenue']
+
+# Seconds a loaded catalog is reused across reruns before it is streamed again
+MOVIES_TTL_SECONDS = 600
+
+def stream_movie_chunks(collection_ref, chunk_size=CHUNK_SIZE):
+    # Fill per-column buffers instead of keeping a list of dicts for the whole collection
+    columns = {}
+    rows = 0
+    for movie in collection_ref.stream():
+        record = movie.to_dict()
+        for key in record:
+            if key not in columns:
+                columns[key] = [None] * rows  # Backfill a field first seen mid-chunk
+        for key, buffer in columns.items():
+            buffer.append(record.get(key))
+        rows += 1
+        if rows == chunk_size:
+            yield pd.DataFrame(columns)
+            columns = {}
+            rows = 0
+    if rows:
+        yield pd.DataFrame(columns)
+
+def count_documents(collection_ref):
+    # Aggregation query so the progress bar knows the total; None if unsupported
+    if not hasattr(collection_ref, "count"):
+        logging.warning("Document count unavailable on this Firestore client, showing progress without a total")
+        return None
+    try:
+        return collection_ref.count().get()[0][0].value
+    except (google_exceptions.InvalidArgument, google_exceptions.Unimplemented) as exc:
+        logging.warning("Document count unavailable, showing progress without a total: %s", exc)
+        return None
 
-# Convert Firestore data to DataFrame
-movies_df = pd.DataFrame(movie_data)
+def load_movies(collection_ref, show_preview):
+    # Stream the catalog chunk by chunk; the per-year preview is only drawn for logged-in users
+    total_movies = count_documents(collection_ref)
+    progress_bar = st.progress(0.0, text="Loading movies...")
+    preview = st.empty()
+    chunks = []
+    loaded = 0
+    year_counts = pd.Series(dtype=float)
+    for chunk in stream_movie_chunks(collection_ref):
+        for column in NUMERIC_COLUMNS:
+            chunk[column] = pd.to_numeric(chunk.get(column, pd.Series([], dtype=float)), errors='coerce')
+        chunks.append(chunk)
+        loaded += len(chunk)
+        if total_movies:
+            progress_bar.progress(min(loaded / total_movies, 1.0), text=f"Loading movies... {loaded}/{total_movies}")
+        else:
+            progress_bar.progress(0.0, text=f"Loading movies... {loaded} loaded")
+        if show_preview:
+            year_counts = year_counts.add(chunk['release_year'].value_counts(), fill_value=0)
+            preview.line_chart(year_counts.sort_index().rename("Movies loaded"))
+    progress_bar.empty()
+    preview.empty()
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+# Fetch all movie data once per session (refreshed after the TTL) so widget reruns skip the stream
+movies_ref = db.collection('movies2')
+if "movies_df" not in st.session_state or time.time() - st.session_state.movies_loaded_at > MOVIES_TTL_SECONDS:
+    st.session_state.movies_df = load_movies(movies_ref, show_preview=bool(st.session_state.get("logged_in_user")))
+    st.session_state.movies_loaded_at = time.time()
 
-# Ensure relevant columns exist
-movies_df['release_year'] = pd.to_numeric(movies_df.get('release_year', pd.Series([])), errors='coerce')
-movies_df['popularity'] = pd.to_numeric(movies_df.get('popularity', pd.Series([])), errors='coerce')
+# Work on a copy so the parsing below never mutates the cached frame
+movies_df = st.session_state.movies_df.copy()
 
 # Safely parse genres_list
 def safe_parse_genres(value):
@@ -305,10 +368,6 @@ def map_country_names(countries):
 movies_df['mapped_production_countries'] = movies_df['production_countries'].apply(map_country_names)
 movies_df = movies_df[movies_df['mapped_production_countries'].apply(lambda x: isinstance(x, list) and len(x) > 0)]
 
-# Ensure numeric values
-movies_df['release_year'] = pd.to_numeric(movies_df.get('release_year', pd.Series([])), errors='coerce')
-movies_df['popularity'] = pd.to_numeric(movies_df.get('popularity', pd.Series([])), errors='coerce')
-
 # Authentication
 if "logged_in_user" not in st.session_state:
     st.session_state.logged_in_user = None